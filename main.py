@@ -1,166 +1,471 @@
 import os
-import csv
-import datetime
-import pandas as pd
-import matplotlib.pyplot as plt
+import re
+import sys
+import argparse
+import math
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+
+# Number of deposit intervals per year for each deposit interval code
+PERIODS_BY_CODE = {
+    'D': 365,
+    'W': 52,
+    'M': 12,
+    'Y': 1
+}
+
+# Rules checked by validate_input_parameters, in order, with the error reported for each
+_VALIDATORS = (
+    (lambda params: not math.isfinite(params['initial_amount']), "The initial amount must be a finite number."),
+    (lambda params: not math.isfinite(params['interest_rate']), "The interest percentage must be a finite number."),
+    (lambda params: not math.isfinite(params['regular_deposit']), "The regular deposit must be a finite number."),
+    (lambda params: params['initial_amount'] < 0, "The initial amount must be a non-negative number."),
+    (lambda params: params['interest_rate'] < 0, "The interest percentage must be a non-negative number."),
+    (lambda params: params['interval'] not in PERIODS_BY_CODE, "The deposit interval must be one of D, W, M or Y."),
+    (lambda params: params['regular_deposit'] < 0, "The regular deposit must be a non-negative number."),
+    (lambda params: params['years'] <= 0, "The number of years must be a positive integer."),
+)
+
+# Function to validate calculation parameters, returning the first error message or None
+def validate_input_parameters(initial_amount, interest_rate, years, interval, regular_deposit):
+    params = {
+        'initial_amount': initial_amount,
+        'interest_rate': interest_rate,
+        'years': years,
+        'interval': interval,
+        'regular_deposit': regular_deposit
+    }
+    return next((message for is_invalid, message in _VALIDATORS if is_invalid(params)), None)
+
+# Deposit interval choices offered by get_interval_input, and the code for each
+_INTERVAL_OPTIONS = ("Daily", "Weekly", "Monthly", "Yearly")
+_INTERVAL_CODES = ("D", "W", "M", "Y")
+
+# Responses accepted by get_yes_no_input
+_YES_NO = frozenset({"y", "n"})
+
+# Checks that typed text is a number before converting it, so bad input needs no exception
+_looks_like_float = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?').fullmatch
+_looks_like_int = re.compile(r'[+-]?\d+').fullmatch
+
+# Function to show a prompt and read one line, without the overhead of input()
+def _prompt(message):
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        # Keep input()'s behaviour of stopping at end of input instead of re-prompting forever
+        raise EOFError
+    return line.rstrip('\n')
 
 # Function to get a non-negative float input from the user
 def get_float_input(prompt):
     while True:
-        try:
-            value = float(input(prompt))
-            if value < 0:
-                print("Error: Please enter a non-negative number.")
-            else:
-                return value
-        except ValueError:
+        text = _prompt(prompt).strip()
+        if not _looks_like_float(text):
             print("Error: Please enter a valid number.")
+            continue
+        value = float(text)
+        if not math.isfinite(value):
+            # Exponents such as 1e400 match the pattern but overflow to inf
+            print("Error: Please enter a valid number.")
+        elif value < 0:
+            print("Error: Please enter a non-negative number.")
+        else:
+            return value
 
 # Function to get a positive integer input from the user
 def get_int_input(prompt):
     while True:
+        text = _prompt(prompt).strip()
+        if not _looks_like_int(text):
+            print("Error: Please enter a valid integer.")
+            continue
         try:
-            value = int(input(prompt))
-            if value <= 0:
-                print("Error: Please enter a positive integer.")
-            else:
-                return value
+            value = int(text)
         except ValueError:
+            # Very long digit strings match the pattern but exceed int()'s digit limit
             print("Error: Please enter a valid integer.")
+            continue
+        if value <= 0:
+            print("Error: Please enter a positive integer.")
+        else:
+            return value
 
 # Function to get the interval for regular deposits from the user
 def get_interval_input():
-    options = [
-        "Daily",
-        "Weekly",
-        "Monthly",
-        "Yearly"
-    ]
     while True:
         print("\nSelect the regular deposit interval:")
-        for i, option in enumerate(options, 1):
+        for i, option in enumerate(_INTERVAL_OPTIONS, 1):
             print(f"{i}. {option}")
+        text = _prompt("Enter your choice (1-4): ").strip()
+        if not _looks_like_int(text):
+            print("Error: Please enter a valid number.")
+            continue
         try:
-            choice = int(input("Enter your choice (1-4): "))
-            if 1 <= choice <= 4:
-                return ['D', 'W', 'M', 'Y'][choice - 1]
-            else:
-                print("Error: Please enter a number between 1 and 4.")
+            choice = int(text)
         except ValueError:
+            # Very long digit strings match the pattern but exceed int()'s digit limit
             print("Error: Please enter a valid number.")
+            continue
+        if 1 <= choice <= 4:
+            return _INTERVAL_CODES[choice - 1]
+        else:
+            print("Error: Please enter a number between 1 and 4.")
 
 # Function to get a yes or no response from the user
 def get_yes_no_input(prompt):
     while True:
-        response = input(f"{prompt} (y/n): ").lower()
-        if response in ['y', 'n']:
+        response = _prompt(f"{prompt} (y/n): ").lower()
+        if response in _YES_NO:
             return response
         else:
             print("Error: Please enter 'y' for Yes or 'n' for No.")
 
+# Function to simulate compound interest period by period
+def _simulate_compound_interest(initial_amount, rate_per_period, years, periods, regular_deposit):
+    total_amounts = np.empty(years)
+    total_invested = np.empty(years)
+    total_amount = initial_amount
+    growth = 1.0 + rate_per_period
+    deposit = regular_deposit
+    deposits_per_year = regular_deposit * periods
+
+    for year in range(years):
+        # Only the balance needs stepping through every period
+        for _ in range(periods):
+            total_amount = total_amount * growth + deposit
+        total_amounts[year] = total_amount
+        total_invested[year] = initial_amount + deposits_per_year * (year + 1)
+
+    return total_amounts, total_invested
+
+# Function to compute compound interest for every year from the closed-form future value
+def _closed_form_compound_interest(initial_amount, rate_per_period, years, periods, regular_deposit):
+    year_numbers = np.arange(1, years + 1)
+    # Work with log(1 + r) so small per-period rates keep their precision
+    log_growth = year_numbers * periods * np.log1p(rate_per_period)
+    growth = np.exp(log_growth)
+    if rate_per_period:
+        # Future value of the deposits made at the end of each period
+        deposit_value = regular_deposit * np.expm1(log_growth) / rate_per_period
+    else:
+        deposit_value = regular_deposit * periods * year_numbers
+    total_amounts = initial_amount * growth + deposit_value
+    total_invested = initial_amount + regular_deposit * periods * year_numbers
+
+    return total_amounts, total_invested
+
+# Function to compile the batch kernel, which computes the yearly total amount of many scenarios, one scenario per row
+def _compile_batch_kernel():
+    from numba import njit, prange
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def closed_form_batch_kernel(initial_amounts, rates_per_period, years, periods, regular_deposits):
+        total_amounts = np.empty((initial_amounts.size, years))
+
+        # Scenarios are independent, so numba can run them on separate cores
+        for i in prange(initial_amounts.size):
+            rate_per_period = rates_per_period[i]
+            # Same log1p/expm1 closed form as _closed_form_batch, so both backends agree
+            log_growth_per_year = periods[i] * math.log1p(rate_per_period)
+            for year in range(years):
+                log_growth = log_growth_per_year * (year + 1)
+                if rate_per_period != 0:
+                    annuity = math.expm1(log_growth) / rate_per_period
+                else:
+                    annuity = periods[i] * (year + 1)
+                total_amounts[i, year] = initial_amounts[i] * math.exp(log_growth) + regular_deposits[i] * annuity
+
+        return total_amounts
+
+    return closed_form_batch_kernel
+
+# Function to compute the yearly total amount of many scenarios with NumPy broadcasting
+def _closed_form_batch(initial_amounts, rates_per_period, years, periods, regular_deposits):
+    year_numbers = np.arange(1, years + 1)
+    log_growth = np.outer(periods * np.log1p(rates_per_period), year_numbers)
+    periods_elapsed = np.outer(periods, year_numbers)
+    has_interest = rates_per_period != 0
+    # Future value of one deposit per period, falling back to the deposit count without interest
+    annuity = np.where(
+        has_interest[:, None],
+        np.expm1(log_growth) / np.where(has_interest, rates_per_period, 1.0)[:, None],
+        periods_elapsed
+    )
+
+    return initial_amounts[:, None] * np.exp(log_growth) + regular_deposits[:, None] * annuity
+
+# Numeric cores, chosen on first use so numba is only imported when calculating
+_compound_core = None
+_cached_compound_core = None
+_batch_core = None
+MIN_CACHED_PERIODS = 1000
+
+# Function to load the compiled kernels when numba is available, the NumPy closed forms otherwise
+def _load_compound_core():
+    global _compound_core, _cached_compound_core, _batch_core
+    if _compound_core is None:
+        try:
+            from numba import njit
+            _compound_core = njit(cache=True, nogil=True)(_simulate_compound_interest)
+            _batch_core = _compile_batch_kernel()
+        except ImportError:
+            _compound_core = _closed_form_compound_interest
+            _batch_core = _closed_form_batch
+        # Remember results of longer calculations, which are often repeated in one session
+        _cached_compound_core = functools.lru_cache(maxsize=128)(_compound_core)
+    return _compound_core, _cached_compound_core
+
+# Function to round amounts to cents like Python's round, which rounds half-cent ties by their exact binary value
+def _round_cents(values):
+    rounded = np.round(values, 2)
+    # np.round scales by 100 first, so it can only disagree with round where the scaled value is
+    # within rounding error of a half cent, or too large for the scaling to be exact
+    scaled = np.abs(values * 100)
+    unsure = (np.abs(scaled - np.floor(scaled) - 0.5) <= 4 * np.finfo(np.float64).eps * scaled) | (scaled >= 2.0 ** 52)
+    if unsure.any():
+        rounded[unsure] = [round(value, 2) for value in values[unsure].tolist()]
+    return rounded
+
 # Function to calculate compound interest with regular deposits
 def calculate_compound_interest(initial_amount, interest_rate, years, interval, regular_deposit):
-    total_amount = initial_amount
-    total_invested = initial_amount
-    data = []
-    
-    # Define the number of intervals per year for each deposit interval
-    intervals_per_year = {
-        'D': 365,
-        'W': 52,
-        'M': 12,
-        'Y': 1
+    periods = PERIODS_BY_CODE[interval]
+    rate_per_period = interest_rate / 100 / periods
+    compound_core, cached_compound_core = _load_compound_core()
+    if years * periods > MIN_CACHED_PERIODS:
+        compound_core = cached_compound_core
+    total_amounts, total_invested = compound_core(
+        float(initial_amount), float(rate_per_period), int(years), periods, float(regular_deposit)
+    )
+
+    # Store the yearly data as one contiguous array per column
+    return {
+        'Year': np.arange(1, years + 1),
+        'Total Amount': _round_cents(total_amounts),
+        'Total Invested': _round_cents(total_invested),
+        # The invested total is not summed like the balance, so a zero interest can round to -0.0
+        'Interest Earned': _round_cents(total_amounts - total_invested) + 0.0
     }
-    
-    # Loop through each year to calculate compound interest
-    for year in range(1, years + 1):
-        for _ in range(intervals_per_year[interval]):
-            total_amount *= (1 + interest_rate / 100 / intervals_per_year[interval])
-            total_amount += regular_deposit
-            total_invested += regular_deposit
-        
-        # Store the yearly data
-        data.append({
-            'Year': year,
-            'Total Amount': round(total_amount, 2),
-            'Total Invested': round(total_invested, 2),
-            'Interest Earned': round(total_amount - total_invested, 2)
-        })
-    
-    return data
+
+# Function to calculate the yearly totals of many scenarios at once
+# Every argument except years may be a single value or a sequence, one entry per scenario
+def calculate_compound_interest_batch(initial_amounts, interest_rates, years, intervals, regular_deposits):
+    if isinstance(intervals, str):
+        intervals = [intervals]
+    # Broadcast results are views that may share memory, so give the kernels flat copies
+    initial_amounts, interest_rates, periods, regular_deposits = (
+        np.array(array).ravel() for array in np.broadcast_arrays(
+            np.asarray(initial_amounts, dtype=np.float64),
+            np.asarray(interest_rates, dtype=np.float64),
+            np.array([PERIODS_BY_CODE[interval] for interval in intervals], dtype=np.int64),
+            np.asarray(regular_deposits, dtype=np.float64)
+        )
+    )
+    rates_per_period = interest_rates / 100 / periods
+
+    _load_compound_core()
+    total_amounts = _batch_core(initial_amounts, rates_per_period, int(years), periods, regular_deposits)
+    total_invested = initial_amounts[:, None] + np.outer(regular_deposits * periods, np.arange(1, years + 1))
+
+    # One row per scenario and one column per year
+    return _round_cents(total_amounts), _round_cents(total_invested)
+
+# Define color scheme for the graphs
+COLOR_INTEREST = '#55a630'
+COLOR_INVESTED = '#e09f3e'
+COLOR_TOTAL = '#0096c7'
+
+# Fast zlib level for the chart PNGs; flat-coloured charts compress well even at level 1
+PNG_PIL_KWARGS = {'compress_level': 1}
+
+# Function to create a chart figure without pyplot, whose global state is not thread-safe
+def _new_figure(figsize=None):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize)
+    # Charts are only saved to PNG files, so render straight to an Agg canvas
+    FigureCanvasAgg(fig)
+    return fig
+
+# Function to generate and save the line chart
+def _line_chart(years, total_amounts, total_invested, interest_earned, path):
+    fig = _new_figure()
+    ax = fig.subplots()
+    ax.plot(years, total_amounts, label='Total Amount', color=COLOR_TOTAL)
+    ax.plot(years, total_invested, label='Total Invested', color=COLOR_INVESTED)
+    ax.plot(years, interest_earned, label='Interest Earned', color=COLOR_INTEREST)
+    ax.set_xlabel('Years')
+    ax.set_ylabel('Amount')
+    ax.set_title('Compound Interest Growth')
+    ax.legend()
+    ax.grid(True)
+    fig.savefig(path, pil_kwargs=PNG_PIL_KWARGS)
+
+# Function to generate and save the pie chart of the final amount
+def _pie_chart(years, total_amounts, total_invested, interest_earned, path):
+    fig = _new_figure((8, 8))
+    ax = fig.subplots()
+    ax.pie([total_invested[-1], interest_earned[-1]], 
+           labels=['Invested Amount', 'Interests Earned'], 
+           autopct='%1.1f%%', 
+           colors=[COLOR_INVESTED, COLOR_INTEREST])
+    ax.set_title('Breakdown of Final Amount')
+    fig.savefig(path, pil_kwargs=PNG_PIL_KWARGS)
+
+# Function to generate and save the stacked bar chart
+def _stacked_bar_chart(years, total_amounts, total_invested, interest_earned, path):
+    fig = _new_figure()
+    ax = fig.subplots()
+    ax.bar(years, total_invested, label='Invested Amount', color=COLOR_INVESTED)
+    ax.bar(years, interest_earned, bottom=total_invested, label='Interests Earned', color=COLOR_INTEREST)
+    ax.set_xlabel('Years')
+    ax.set_ylabel('Amount')
+    ax.set_title('Compound Interest Growth (Stacked)')
+    ax.legend()
+    fig.savefig(path, pil_kwargs=PNG_PIL_KWARGS)
+
+# Style shared by the charts, applied once around all of them; the pie chart sets its own size
+CHART_STYLE = {
+    'figure.figsize': (12, 6)
+}
+
+# Charts saved by generate_graphs, with the file name of each
+CHARTS = (
+    (_line_chart, 'compound_interest_line_chart.png'),
+    (_pie_chart, 'compound_interest_pie_chart.png'),
+    (_stacked_bar_chart, 'compound_interest_stacked_bar_chart.png')
+)
 
 # Function to generate and save graphs based on the calculated data
 def generate_graphs(data, folder_path):
-    years = [entry['Year'] for entry in data]
-    total_amounts = [entry['Total Amount'] for entry in data]
-    total_invested = [entry['Total Invested'] for entry in data]
-    interest_earned = [entry['Interest Earned'] for entry in data]
+    # Import matplotlib only when graphs are actually saved
+    import matplotlib
 
-    # Define color scheme for the graphs
-    color_interest = '#55a630'
-    color_invested = '#e09f3e'
-    color_total = '#0096c7'
+    columns = (data['Year'], data['Total Amount'], data['Total Invested'], data['Interest Earned'])
 
     # Create a folder to save the graphs
     graphs_folder = os.path.join(folder_path, 'graphs')
     os.makedirs(graphs_folder, exist_ok=True)
 
-    # Generate and save line chart
-    plt.figure(figsize=(12, 6))
-    plt.plot(years, total_amounts, label='Total Amount', color=color_total)
-    plt.plot(years, total_invested, label='Total Invested', color=color_invested)
-    plt.plot(years, interest_earned, label='Interest Earned', color=color_interest)
-    plt.xlabel('Years')
-    plt.ylabel('Amount')
-    plt.title('Compound Interest Growth')
-    plt.legend()
-    plt.grid(True)
-    plt.savefig(os.path.join(graphs_folder, 'compound_interest_line_chart.png'))
-    plt.close()
-
-    # Generate and save pie chart
-    plt.figure(figsize=(8, 8))
-    plt.pie([total_invested[-1], interest_earned[-1]], 
-            labels=['Invested Amount', 'Interests Earned'], 
-            autopct='%1.1f%%', 
-            colors=[color_invested, color_interest])
-    plt.title('Breakdown of Final Amount')
-    plt.savefig(os.path.join(graphs_folder, 'compound_interest_pie_chart.png'))
-    plt.close()
-
-    # Generate and save stacked bar chart
-    plt.figure(figsize=(12, 6))
-    plt.bar(years, total_invested, label='Invested Amount', color=color_invested)
-    plt.bar(years, interest_earned, bottom=total_invested, label='Interests Earned', color=color_interest)
-    plt.xlabel('Years')
-    plt.ylabel('Amount')
-    plt.title('Compound Interest Growth (Stacked)')
-    plt.legend()
-    plt.savefig(os.path.join(graphs_folder, 'compound_interest_stacked_bar_chart.png'))
-    plt.close()
+    # Charts share no state, so each one is drawn and saved on its own thread
+    with matplotlib.rc_context(CHART_STYLE), ThreadPoolExecutor(max_workers=len(CHARTS)) as executor:
+        futures = [
+            executor.submit(chart, *columns, os.path.join(graphs_folder, file_name))
+            for chart, file_name in CHARTS
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 # Function to save data to an Excel file
 def save_to_excel(data, folder_path):
-    df = pd.DataFrame(data)
-    df.to_excel(os.path.join(folder_path, 'compound_interest_data.xlsx'), index=False)
+    # Import pandas only when the data is actually saved
+    import pandas as pd
+
+    excel_path = os.path.join(folder_path, 'compound_interest_data.xlsx')
+    try:
+        # xlsxwriter avoids building an openpyxl cell tree for the whole sheet
+        writer = pd.ExcelWriter(excel_path, engine='xlsxwriter')
+    except ImportError:
+        # Fall back to openpyxl in write-only mode, which streams rows instead of keeping every cell
+        import openpyxl
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Sheet1')
+        worksheet.append(list(data))
+        for row in zip(*(column.tolist() for column in data.values())):
+            worksheet.append(row)
+        workbook.save(excel_path)
+        return
+    with writer:
+        pd.DataFrame(data).to_excel(writer, index=False)
 
 # Function to save data to a CSV file
 def save_to_csv(data, folder_path):
     csv_path = os.path.join(folder_path, 'compound_interest_data.csv')
+    # Format each column once as strings and write the whole file in a single call
+    lines = np.char.mod('%d', data['Year'])
+    for column in ('Total Amount', 'Total Invested', 'Interest Earned'):
+        lines = np.char.add(np.char.add(lines, ','), np.char.mod('%.2f', data[column]))
+    # End lines with '\r\n' like csv.DictWriter did
     with open(csv_path, 'w', newline='') as csvfile:
-        fieldnames = ['Year', 'Total Amount', 'Total Invested', 'Interest Earned']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        writer.writeheader()
-        for row in data:
-            writer.writerow(row)
+        csvfile.write(','.join(data) + '\r\n' + '\r\n'.join(lines) + '\r\n')
+
+# Function to create a unique, timestamped folder for the results of a calculation
+def create_results_folder(parent_folder, initial_amount, interest_rate, interval, regular_deposit):
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    folder_name = "_".join((str(initial_amount), str(interest_rate), interval, str(regular_deposit), timestamp))
+    folder_path = os.path.join(parent_folder, folder_name)
+    os.makedirs(folder_path, exist_ok=True)
+    return folder_name, folder_path
 
 # Function to format values as currency
 def format_currency(value):
     return f"${value:,.2f}"
 
+# Function to display the final values of a calculation
+def display_results(data):
+    # Extract final values for display
+    total_invested = data['Total Invested'][-1]
+    total_interest = data['Interest Earned'][-1]
+    final_amount = data['Total Amount'][-1]
+
+    # Display results
+    print(f"\nTotal amount invested: {format_currency(total_invested)}")
+    print(f"Total amount in interest: {format_currency(total_interest)}")
+    print(f"Final Amount: {format_currency(final_amount)}")
+
+# Function to save the data and graphs of a calculation in a new folder
+def save_results(data, parent_folder, initial_amount, interest_rate, interval, regular_deposit):
+    # Create a unique folder to save the data
+    folder_name, folder_path = create_results_folder(parent_folder, initial_amount, interest_rate, interval, regular_deposit)
+
+    # Generate and save graphs, and save data to files
+    generate_graphs(data, folder_path)
+    save_to_excel(data, folder_path)
+    save_to_csv(data, folder_path)
+    print(f"Data and graphs saved in folder: {folder_name}")
+    print(f"Files generated: compound_interest_data.xlsx, compound_interest_data.csv, and graph images")
+
+# Function to parse the command-line arguments for a non-interactive run
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Calculate compound interest with regular deposits. "
+                    "Without arguments, the parameters are asked for interactively."
+    )
+    parser.add_argument("--initial", type=float, help="initial amount")
+    parser.add_argument("--rate", type=float, help="yearly interest percentage")
+    parser.add_argument("--years", type=int, help="number of years")
+    parser.add_argument("--interval", type=str.upper, choices=PERIODS_BY_CODE,
+                        help="regular deposit interval: D (daily), W (weekly), M (monthly) or Y (yearly)")
+    parser.add_argument("--deposit", type=float, help="regular deposit amount")
+    parser.add_argument("--batch", action="store_true",
+                        help="run once without prompts and save the results (implied by any parameter)")
+    args = parser.parse_args(argv)
+
+    parameters = ("initial", "rate", "years", "interval", "deposit")
+    if args.batch or any(getattr(args, name) is not None for name in parameters):
+        args.batch = True
+        missing = [f"--{name}" for name in parameters if getattr(args, name) is None]
+        if missing:
+            parser.error(f"the following arguments are required without prompts: {', '.join(missing)}")
+        error = validate_input_parameters(args.initial, args.rate, args.years, args.interval, args.deposit)
+        if error:
+            parser.error(error)
+    return args
+
+# Function to run a single calculation from command-line arguments and save it
+def run_batch(args):
+    data = calculate_compound_interest(args.initial, args.rate, args.years, args.interval, args.deposit)
+    display_results(data)
+    save_results(data, os.getcwd(), args.initial, args.rate, args.interval, args.deposit)
+
 # Main function to run the compound interest calculator
 def main():
+    # Results are saved under the directory the calculator was started from
+    cwd = os.getcwd()
+
     while True:
         # Collect user inputs
         initial_amount = get_float_input("Enter the initial amount: ")
@@ -171,33 +476,13 @@ def main():
 
         # Calculate compound interest
         data = calculate_compound_interest(initial_amount, interest_rate, years, interval, regular_deposit)
-
-        # Extract final values for display
-        total_invested = data[-1]['Total Invested']
-        total_interest = data[-1]['Interest Earned']
-        final_amount = data[-1]['Total Amount']
-
-        # Display results
-        print(f"\nTotal amount invested: {format_currency(total_invested)}")
-        print(f"Total amount in interest: {format_currency(total_interest)}")
-        print(f"Final Amount: {format_currency(final_amount)}")
+        display_results(data)
 
         # Ask if user wants to save the data
         save_data = get_yes_no_input("\nDo you want to save the data?")
 
         if save_data == 'y':
-            # Create a unique folder to save the data
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            folder_name = f"{initial_amount}_{interest_rate}_{interval}_{regular_deposit}_{timestamp}"
-            folder_path = os.path.join(os.getcwd(), folder_name)
-            os.makedirs(folder_path, exist_ok=True)
-
-            # Generate and save graphs, and save data to files
-            generate_graphs(data, folder_path)
-            save_to_excel(data, folder_path)
-            save_to_csv(data, folder_path)
-            print(f"Data and graphs saved in folder: {folder_name}")
-            print(f"Files generated: compound_interest_data.xlsx, compound_interest_data.csv, and graph images")
+            save_results(data, cwd, initial_amount, interest_rate, interval, regular_deposit)
 
         # Ask if user wants to perform another calculation
         another_calculation = get_yes_no_input("Do you want to do another calculation?")
@@ -207,4 +492,8 @@ def main():
 
 # Entry point of the script
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_arguments()
+    if args.batch:
+        run_batch(args)
+    else:
+        main()
@@ -0,0 +1,150 @@
+import io
+import os
+import sys
+import math
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import main
+
+# Scenarios as (initial amount, interest percentage, years, interval, regular deposit)
+SCENARIOS = [
+    (1000, 3, 10, 'M', 150),
+    (0, 3, 10, 'Y', 150),
+    (0, 0, 5, 'D', 10),
+    (5000, 7.5, 40, 'D', 3),
+    (100, 12, 30, 'W', 0),
+    (123.45, 5, 40, 'M', 99.99),
+    (0.1, 0, 30, 'D', 0.7)
+]
+
+# Function to calculate the yearly rows the way the original per-period loop did
+def reference_compound_interest(initial_amount, interest_rate, years, interval, regular_deposit):
+    periods = main.PERIODS_BY_CODE[interval]
+    total_amount = initial_amount
+    total_invested = initial_amount
+    rows = []
+    for year in range(1, years + 1):
+        for _ in range(periods):
+            total_amount *= (1 + interest_rate / 100 / periods)
+            total_amount += regular_deposit
+            total_invested += regular_deposit
+        rows.append((round(total_amount, 2), round(total_invested, 2), round(total_amount - total_invested, 2)))
+    return rows
+
+# Test that the per-period loop and the closed form agree before rounding
+@pytest.mark.parametrize("initial_amount, interest_rate, years, interval, regular_deposit", SCENARIOS)
+def test_loop_matches_closed_form(initial_amount, interest_rate, years, interval, regular_deposit):
+    periods = main.PERIODS_BY_CODE[interval]
+    args = (float(initial_amount), interest_rate / 100 / periods, years, periods, float(regular_deposit))
+    loop_amounts, loop_invested = main._simulate_compound_interest(*args)
+    closed_amounts, closed_invested = main._closed_form_compound_interest(*args)
+    np.testing.assert_allclose(closed_amounts, loop_amounts, rtol=1e-9)
+    np.testing.assert_allclose(closed_invested, loop_invested, rtol=1e-12)
+
+# Test that the calculated columns stay within a cent of the original loop
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_calculate_compound_interest_matches_reference(scenario):
+    data = main.calculate_compound_interest(*scenario)
+    expected = np.array(reference_compound_interest(*scenario))
+    assert data['Year'].tolist() == list(range(1, scenario[2] + 1))
+    for index, column in enumerate(('Total Amount', 'Total Invested', 'Interest Earned')):
+        np.testing.assert_allclose(data[column], expected[:, index], rtol=0, atol=0.0100001)
+        # A zero amount must not be written as -0.00
+        assert np.signbit(data[column]).tolist() == np.signbit(expected[:, index]).tolist()
+
+# Test that half-cent ties are rounded like Python's round, not np.round
+def test_round_cents_uses_python_round():
+    values = np.array([463.635, 2.675, 0.125, 1.005])
+    assert main._round_cents(values).tolist() == [round(value, 2) for value in values.tolist()]
+    assert main.calculate_compound_interest(0, 3, 10, 'Y', 150)['Total Amount'][2] == 463.63
+
+# Test that the numba kernels and the NumPy fallbacks give the same results
+def test_numba_matches_numpy_fallback():
+    pytest.importorskip("numba")
+    compound_core, _ = main._load_compound_core()
+    batch_kernel = main._compile_batch_kernel()
+    for initial_amount, interest_rate, years, interval, regular_deposit in SCENARIOS:
+        periods = main.PERIODS_BY_CODE[interval]
+        args = (float(initial_amount), interest_rate / 100 / periods, years, periods, float(regular_deposit))
+        compiled_amounts, compiled_invested = compound_core(*args)
+        fallback_amounts, fallback_invested = main._closed_form_compound_interest(*args)
+        np.testing.assert_allclose(compiled_amounts, fallback_amounts, rtol=1e-9)
+        np.testing.assert_allclose(compiled_invested, fallback_invested, rtol=1e-12)
+
+    initial_amounts, interest_rates, years, intervals, regular_deposits = map(np.array, zip(*SCENARIOS))
+    periods = np.array([main.PERIODS_BY_CODE[interval] for interval in intervals], dtype=np.int64)
+    batch_args = (
+        initial_amounts.astype(np.float64), interest_rates / 100 / periods, 40, periods, regular_deposits.astype(np.float64)
+    )
+    np.testing.assert_allclose(batch_kernel(*batch_args), main._closed_form_batch(*batch_args), rtol=1e-12)
+
+# Test that every row of a batch matches the single calculation of that scenario
+def test_batch_matches_single_calculations():
+    initial_amounts, interest_rates, _, intervals, regular_deposits = zip(*SCENARIOS)
+    total_amounts, total_invested = main.calculate_compound_interest_batch(
+        initial_amounts, interest_rates, 20, intervals, regular_deposits
+    )
+    assert total_amounts.shape == total_invested.shape == (len(SCENARIOS), 20)
+    for row, (initial_amount, interest_rate, _, interval, regular_deposit) in enumerate(SCENARIOS):
+        data = main.calculate_compound_interest(initial_amount, interest_rate, 20, interval, regular_deposit)
+        np.testing.assert_allclose(total_amounts[row], data['Total Amount'], rtol=0, atol=0.0100001)
+        np.testing.assert_array_equal(total_invested[row], data['Total Invested'])
+
+# Test that a negative rate grows the deposits like the single calculation does
+def test_batch_matches_single_calculation_with_negative_rate():
+    total_amounts, _ = main.calculate_compound_interest_batch(100, -1, 3, 'M', 10)
+    data = main.calculate_compound_interest(100, -1, 3, 'M', 10)
+    np.testing.assert_allclose(total_amounts[0], data['Total Amount'], rtol=0, atol=0.0100001)
+
+# Test that a single value is broadcast against sequences in a batch
+def test_batch_broadcasts_single_values():
+    total_amounts, total_invested = main.calculate_compound_interest_batch(1000, [1, 2, 3], 10, 'M', 100)
+    assert total_amounts.shape == (3, 10)
+    assert np.all(np.diff(total_amounts[:, -1]) > 0)
+    assert np.all(total_invested == total_invested[0])
+
+# Test that valid parameters pass validation
+def test_validate_input_parameters_accepts_valid_input():
+    assert main.validate_input_parameters(1000, 3, 10, 'M', 150) is None
+    assert main.validate_input_parameters(0, 0, 1, 'Y', 0) is None
+
+# Test that each invalid parameter is reported
+@pytest.mark.parametrize("parameters", [
+    (-1, 3, 10, 'M', 150),
+    (1000, -3, 10, 'M', 150),
+    (1000, 3, 10, 'M', -150),
+    (1000, 3, 0, 'M', 150),
+    (1000, 3, 10, 'X', 150),
+    (math.nan, 3, 10, 'M', 150),
+    (1000, math.inf, 10, 'M', 150),
+    (1000, 3, 10, 'M', -math.inf)
+])
+def test_validate_input_parameters_rejects_invalid_input(parameters):
+    assert main.validate_input_parameters(*parameters)
+
+# Test that integer prompts ask again when the digits exceed int()'s limit instead of crashing
+def test_integer_prompts_reject_too_many_digits(monkeypatch, capsys):
+    too_many_digits = '1' * 5000
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(f"{too_many_digits}\n40\n"))
+    assert main.get_int_input("Enter the number of years: ") == 40
+    assert "Error: Please enter a valid integer." in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(f"{too_many_digits}\n3\n"))
+    assert main.get_interval_input() == 'M'
+    assert "Error: Please enter a valid number." in capsys.readouterr().out
+
+# Test that the CSV file has the original header, line endings and two-decimal amounts
+def test_save_to_csv(tmp_path):
+    data = main.calculate_compound_interest(1000, 3, 2, 'M', 150)
+    main.save_to_csv(data, tmp_path)
+    with open(tmp_path / 'compound_interest_data.csv', 'rb') as csvfile:
+        content = csvfile.read()
+    assert content == (
+        b"Year,Total Amount,Total Invested,Interest Earned\r\n"
+        b"1,2855.37,2800.00,55.37\r\n"
+        b"2,4767.18,4600.00,167.18\r\n"
+    )